@@ -81,5 +81,7 @@ class Job(Base):
     progress = Column(Integer, default=0)  # 0-100 percentage
     total = Column(Integer)  # Total companies to process
     current = Column(Integer, default=0)  # Companies processed so far
+    added = Column(Integer, default=0)  # Companies newly added to the collection
+    skipped_duplicates = Column(Integer, default=0)  # Companies already present or missing
     email = Column(String, nullable=True)  # Optional email for notifications
 
@@ -0,0 +1,133 @@
+# app/job_progress.py
+import os
+import threading
+import uuid
+from time import monotonic
+from typing import Dict, Optional
+
+from sqlalchemy import update
+
+from backend.db import database
+
+# Minimum time between progress writes to the jobs table for a single job.
+# Each insert takes at least ~200ms (throttle trigger plus sleep), so 2s keeps
+# progress writes at or below the old "every 10 companies" rate.
+FLUSH_INTERVAL_SECONDS = float(os.getenv("JOB_PROGRESS_FLUSH_INTERVAL_SECONDS", "2.0"))
+
+
+class JobProgress:
+    """In-memory progress for a job executing in this process.
+
+    The worker records every processed company here; the counts are written
+    to the jobs table at most once per FLUSH_INTERVAL_SECONDS on a dedicated
+    connection, so progress updates never share a transaction with the
+    worker's inserts. Periodic writes are best-effort: a failure is logged and
+    retried on the next record. finish() always writes the exact final counts.
+    """
+
+    def __init__(self, job_id: uuid.UUID, total: int):
+        self.job_id = job_id
+        self.total = total
+        self.status = "running"
+        self.added = 0
+        self.skipped_duplicates = 0
+        self._lock = threading.Lock()
+        # The jobs row already holds the initial values, so wait a full interval
+        self._last_flush = monotonic()
+
+    @property
+    def current(self) -> int:
+        return self.added + self.skipped_duplicates
+
+    @property
+    def progress(self) -> int:
+        if self.status == "completed":
+            return 100
+        return int((self.current / self.total) * 100) if self.total > 0 else 0
+
+    def set_total(self, total: int):
+        with self._lock:
+            self.total = total
+        self._flush(force=True)
+
+    def record_added(self):
+        with self._lock:
+            self.added += 1
+        self._flush()
+
+    def record_skipped(self):
+        with self._lock:
+            self.skipped_duplicates += 1
+        self._flush()
+
+    def finish(self, status: str):
+        with self._lock:
+            self.status = status
+        try:
+            self._flush(force=True)
+        finally:
+            stop(self.job_id)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "status": self.status,
+                "progress": self.progress,
+                "current": self.current,
+                "total": self.total,
+                "added": self.added,
+                "skipped_duplicates": self.skipped_duplicates,
+            }
+
+    def _flush(self, force: bool = False):
+        now = monotonic()
+        if not force and now - self._last_flush < FLUSH_INTERVAL_SECONDS:
+            return
+        try:
+            self._write()
+        except Exception as e:
+            if force:
+                raise
+            # Progress is not on the data path; leave _last_flush so the next record retries
+            print(f"Job {self.job_id}: progress flush failed: {e}", flush=True)
+            return
+        self._last_flush = now
+
+    def _write(self):
+        values = self.snapshot()
+        with database.engine.begin() as conn:
+            conn.execute(
+                update(database.Job)
+                .where(database.Job.id == self.job_id)
+                .values(
+                    status=values["status"],
+                    progress=values["progress"],
+                    current=values["current"],
+                    total=values["total"],
+                    added=values["added"],
+                    skipped_duplicates=values["skipped_duplicates"],
+                )
+            )
+
+
+_live_jobs: Dict[uuid.UUID, JobProgress] = {}
+_live_jobs_lock = threading.Lock()
+
+
+def start(job_id: uuid.UUID, total: int) -> JobProgress:
+    tracker = JobProgress(job_id, total)
+    with _live_jobs_lock:
+        _live_jobs[job_id] = tracker
+    return tracker
+
+
+def get(job_id: uuid.UUID) -> Optional[JobProgress]:
+    with _live_jobs_lock:
+        return _live_jobs.get(job_id)
+
+
+def stop(job_id: uuid.UUID):
+    """Drop a job from the live registry; status reads fall back to the jobs table."""
+    with _live_jobs_lock:
+        _live_jobs.pop(job_id, None)
@@ -8,7 +8,7 @@ from pydantic import BaseModel, EmailStr
 from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
-from backend.db import database
+from backend.db import database, job_progress
 from backend.routes.companies import (
     CompanyBatchOutput,
     fetch_companies_with_liked,
@@ -141,6 +141,8 @@ def add_companies_bulk_to_collection(
         progress=0,
         total=total_count,
         current=0,
+        added=0,
+        skipped_duplicates=0,
         email=request.email
     )
     db.add(job)
@@ -161,6 +163,7 @@ def add_companies_bulk_to_collection(
         request.email,
         request.source_collection_id,
         request.limit_n,
+        total_count,
     )
     
     return AddCompaniesBulkResponse(
@@ -176,14 +179,21 @@ def get_job_status(
     db: Session = Depends(database.get_db),
 ):
     """Get the status of a background job"""
+    # Jobs running in this process report live progress from memory
+    tracker = job_progress.get(job_id)
+    if tracker:
+        return JobStatusResponse(**tracker.snapshot())
+
     job = db.query(database.Job).get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Derive added and skipped for UI without schema changes
-    added = job.current or 0
-    total = job.total or 0
-    skipped = max(total - added, 0)
+    # Jobs created before the count columns existed have NULLs; derive them as before
+    added = job.added if job.added is not None else (job.current or 0)
+    if job.skipped_duplicates is not None:
+        skipped = job.skipped_duplicates
+    else:
+        skipped = max((job.total or 0) - added, 0)
     return JobStatusResponse(
         job_id=job.id,
         status=job.status,
@@ -212,21 +222,23 @@ def list_active_jobs(db: Session = Depends(database.get_db)):
     )
     items: list[ActiveJobItem] = []
     for job in jobs:
-        items.append(
-            ActiveJobItem(
-                job_id=job.id,
-                status=job.status,
-                progress=job.progress,
-                current=job.current,
-                total=job.total,
-            )
-        )
+        tracker = job_progress.get(job.id)
+        values = tracker.snapshot() if tracker else {
+            "job_id": job.id,
+            "status": job.status,
+            "progress": job.progress,
+            "current": job.current,
+            "total": job.total,
+        }
+        items.append(ActiveJobItem(**values))
     return items
 
 
-def process_bulk_operation(job_id: uuid.UUID, company_ids: List[int], collection_id: uuid.UUID, email: Optional[str] = None, source_collection_id: Optional[uuid.UUID] = None, limit_n: Optional[int] = None):
+def process_bulk_operation(job_id: uuid.UUID, company_ids: List[int], collection_id: uuid.UUID, email: Optional[str] = None, source_collection_id: Optional[uuid.UUID] = None, limit_n: Optional[int] = None, total_count: Optional[int] = None):
     """Background task to process bulk company addition with throttle respect"""
     db = database.SessionLocal()
+    # Seed with the total already stored on the job row; IDs may still need fetching
+    tracker = job_progress.start(job_id, total_count if total_count is not None else len(company_ids))
     
     try:
         # If client didn't send IDs, build them server-side for faster init
@@ -240,17 +252,19 @@ def process_bulk_operation(job_id: uuid.UUID, company_ids: List[int], collection
             company_ids = [row[0] for row in query.all()]
 
         total = len(company_ids)
+        if total != tracker.total:
+            tracker.set_total(total)
         # Log entry
         try:
             print(f"Job {job_id}: processing started (total={total})", flush=True)
         except Exception:
             pass
-        companies_added = 0
         
-        for i, company_id in enumerate(company_ids):
+        for company_id in company_ids:
             # Check if company exists
             company = db.query(database.Company).get(company_id)
             if not company:
+                tracker.record_skipped()
                 continue
             
             # Check if association already exists
@@ -260,6 +274,7 @@ def process_bulk_operation(job_id: uuid.UUID, company_ids: List[int], collection
             ).first()
             
             if existing:
+                tracker.record_skipped()
                 continue  # Skip if already exists
             
             # Create association (this will trigger the 100ms throttle automatically)
@@ -269,33 +284,23 @@ def process_bulk_operation(job_id: uuid.UUID, company_ids: List[int], collection
             )
             db.add(association)
             db.commit()
-            companies_added += 1
+            # Progress is kept in memory and flushed to the jobs table on its own cadence
+            tracker.record_added()
             
             # For some reason the throttle isn't working so I added this here
             time.sleep(0.1)
             
             # Log progress every 100 companies (and once at first add)
-            if companies_added == 1 or companies_added % 100 == 0:
+            if tracker.added == 1 or tracker.added % 100 == 0:
                 try:
-                    print(f"Job {job_id}: Added {companies_added} companies so far...", flush=True)
+                    print(f"Job {job_id}: Added {tracker.added} companies so far...", flush=True)
                 except Exception:
                     pass
-
-            # Update progress every 10 companies
-            if (i + 1) % 10 == 0 or (i + 1) == total:
-                progress = int((companies_added / total) * 100) if total > 0 else 100
-                job = db.query(database.Job).get(job_id)
-                job.current = companies_added
-                job.progress = progress
-                db.commit()
         
-        # Mark job as completed
-        job = db.query(database.Job).get(job_id)
-        job.status = "completed"
-        job.progress = 100
-        db.commit()
+        # Mark job as completed, writing the exact final counts
+        tracker.finish("completed")
         try:
-            print(f"Job {job_id} completed successfully: total_added={companies_added}", flush=True)
+            print(f"Job {job_id} completed successfully: total_added={tracker.added}", flush=True)
         except Exception:
             pass
         
@@ -304,17 +309,25 @@ def process_bulk_operation(job_id: uuid.UUID, company_ids: List[int], collection
             collection = db.query(database.CompanyCollection).get(collection_id)
             collection_name = collection.collection_name if collection else str(collection_id)
             print(
-                f"[EmailMock] To: {email} | Job: {job_id} | Collection: {collection_name} | Added: {companies_added}",
+                f"[EmailMock] To: {email} | Job: {job_id} | Collection: {collection_name} | Added: {tracker.added}",
                 flush=True,
             )
             
     except Exception as e:
-        # Mark job as failed
-        job = db.query(database.Job).get(job_id)
-        job.status = "failed"
-        db.commit()
+        # Mark job as failed (on the tracker's own connection, the session may be unusable)
+        try:
+            db.rollback()
+        except Exception as rollback_error:
+            print(f"Job {job_id}: rollback failed: {rollback_error}", flush=True)
+        try:
+            tracker.finish("failed")
+        except Exception as flush_error:
+            # Don't let the status write mask the error that failed the job
+            print(f"Job {job_id}: failed to record failed status: {flush_error}", flush=True)
         raise
     finally:
+        # Always drop the live tracker so status reads can't outlive the worker
+        job_progress.stop(job_id)
         db.close()
 
 
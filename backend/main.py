@@ -14,6 +14,13 @@ from backend.routes import collections, companies
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     database.Base.metadata.create_all(bind=database.engine)
+    # create_all doesn't alter existing tables, so add job count columns explicitly.
+    # No default: pre-existing jobs keep NULL and get derived counts in get_job_status.
+    with database.engine.begin() as conn:
+        conn.execute(text("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS added INTEGER;"))
+        conn.execute(
+            text("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS skipped_duplicates INTEGER;")
+        )
 
     db = database.SessionLocal()
     if not db.query(database.Settings).get("seeded"):
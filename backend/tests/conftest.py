@@ -0,0 +1,57 @@
+import os
+from contextlib import contextmanager
+
+import pytest
+
+# database.py builds its engine at import time; tests never touch a real DB
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from backend.db import database, job_progress  # noqa: E402
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def execute(self, statement):
+        if self.engine.fail:
+            raise RuntimeError("connection lost")
+        self.engine.writes.append(statement.compile().params)
+
+
+class FakeEngine:
+    """Records the values of every UPDATE issued against the jobs table."""
+
+    def __init__(self):
+        self.writes = []
+        self.fail = False
+
+    @contextmanager
+    def begin(self):
+        yield FakeConnection(self)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake = FakeEngine()
+    monkeypatch.setattr(database, "engine", fake)
+    return fake
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(job_progress, "monotonic", fake)
+    monkeypatch.setattr(job_progress, "FLUSH_INTERVAL_SECONDS", 2.0)
+    return fake
@@ -0,0 +1,144 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from backend.db import database, job_progress
+from backend.routes import collections
+
+
+class FakeQuery:
+    def __init__(self, session, entity):
+        self.session = session
+        self.entity = entity
+        self.criteria = {}
+
+    def filter(self, *criteria):
+        for criterion in criteria:
+            self.criteria.update(criterion.compile().params)
+        return self
+
+    def limit(self, n):
+        self.criteria["limit"] = n
+        return self
+
+    def get(self, ident):
+        if self.entity is database.Company and ident in self.session.company_ids:
+            return SimpleNamespace(id=ident)
+        return None
+
+    def first(self):
+        if self.criteria.get("company_id_1") in self.session.associated_ids:
+            return SimpleNamespace(company_id=self.criteria["company_id_1"])
+        return None
+
+    def all(self):
+        ids = self.session.source_ids
+        if "limit" in self.criteria:
+            ids = ids[: self.criteria["limit"]]
+        return [(company_id,) for company_id in ids]
+
+
+class FakeBulkSession:
+    """Insert session stub: existing companies, existing associations and a source list."""
+
+    def __init__(self, company_ids, associated_ids=(), source_ids=(), fail_on_commit=False):
+        self.company_ids = set(company_ids)
+        self.associated_ids = set(associated_ids)
+        self.source_ids = list(source_ids)
+        self.fail_on_commit = fail_on_commit
+        self.queried = []
+        self.added = []
+        self.closed = False
+
+    def query(self, entity):
+        self.queried.append(entity)
+        return FakeQuery(self, entity)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        if self.fail_on_commit:
+            raise RuntimeError("insert failed")
+
+    def rollback(self):
+        if self.fail_on_commit:
+            raise RuntimeError("connection dropped")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(collections, "time", SimpleNamespace(sleep=lambda seconds: None))
+
+
+def run(monkeypatch, session, job_id, company_ids, **kwargs):
+    monkeypatch.setattr(database, "SessionLocal", lambda: session)
+    collections.process_bulk_operation(job_id, company_ids, uuid.uuid4(), **kwargs)
+
+
+def test_counts_duplicates_and_missing_as_skipped(monkeypatch, engine, clock, no_sleep):
+    job_id = uuid.uuid4()
+    # 4 is already in the collection, 99 doesn't exist
+    session = FakeBulkSession(company_ids={1, 2, 3, 4}, associated_ids={4})
+
+    run(monkeypatch, session, job_id, [1, 2, 3, 4, 99], total_count=5)
+
+    final = engine.writes[-1]
+    assert final["status"] == "completed"
+    assert final["added"] == 3
+    assert final["skipped_duplicates"] == 2
+    assert final["current"] == final["added"] + final["skipped_duplicates"] == 5
+    assert final["total"] == 5
+    assert final["progress"] == 100
+    assert [a.company_id for a in session.added] == [1, 2, 3]
+    assert database.Job not in session.queried
+    assert not any(isinstance(obj, database.Job) for obj in session.added)
+    assert job_progress.get(job_id) is None
+    assert session.closed
+
+
+def test_source_collection_reseeds_total(monkeypatch, engine, clock, no_sleep):
+    job_id = uuid.uuid4()
+    session = FakeBulkSession(company_ids={1, 2}, source_ids=[1, 2])
+
+    # The route counted 3 associations, but only 2 IDs come back
+    run(
+        monkeypatch,
+        session,
+        job_id,
+        [],
+        source_collection_id=uuid.uuid4(),
+        total_count=3,
+    )
+
+    assert engine.writes[0]["total"] == 2
+    assert engine.writes[-1]["total"] == 2
+    assert engine.writes[-1]["added"] == 2
+
+
+def test_failure_records_failed_status_and_unregisters(monkeypatch, engine, clock, no_sleep):
+    job_id = uuid.uuid4()
+    # Both the insert commit and the rollback raise, as when the connection drops
+    session = FakeBulkSession(company_ids={1}, fail_on_commit=True)
+
+    with pytest.raises(RuntimeError, match="insert failed"):
+        run(monkeypatch, session, job_id, [1], total_count=1)
+
+    assert engine.writes[-1]["status"] == "failed"
+    assert job_progress.get(job_id) is None
+    assert session.closed
+
+
+def test_unregisters_when_failed_status_write_also_fails(monkeypatch, engine, clock, no_sleep):
+    job_id = uuid.uuid4()
+    session = FakeBulkSession(company_ids={1}, fail_on_commit=True)
+    engine.fail = True
+
+    with pytest.raises(RuntimeError, match="insert failed"):
+        run(monkeypatch, session, job_id, [1], total_count=1)
+
+    assert job_progress.get(job_id) is None
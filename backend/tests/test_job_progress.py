@@ -0,0 +1,126 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from backend.db import job_progress
+from backend.routes import collections
+
+
+def test_periodic_writes_are_bounded(engine, clock):
+    tracker = job_progress.start(uuid.uuid4(), 100)
+
+    # 50 records over 5 seconds at 100ms each
+    for _ in range(50):
+        clock.advance(0.1)
+        tracker.record_added()
+
+    assert len(engine.writes) == 2
+    tracker.finish("completed")
+
+
+def test_finish_writes_exact_counts_and_unregisters(engine, clock):
+    job_id = uuid.uuid4()
+    tracker = job_progress.start(job_id, 5)
+    for _ in range(3):
+        tracker.record_added()
+    for _ in range(2):
+        tracker.record_skipped()
+
+    # Nothing flushed yet inside the interval
+    assert engine.writes == []
+    assert job_progress.get(job_id) is tracker
+
+    tracker.finish("completed")
+
+    final = engine.writes[-1]
+    assert final["status"] == "completed"
+    assert final["added"] == 3
+    assert final["skipped_duplicates"] == 2
+    assert final["current"] == 5
+    assert final["progress"] == 100
+    assert job_progress.get(job_id) is None
+
+
+def test_failed_periodic_flush_is_retried_on_next_record(engine, clock):
+    tracker = job_progress.start(uuid.uuid4(), 10)
+    engine.fail = True
+    clock.advance(2.0)
+    tracker.record_added()
+    assert engine.writes == []
+
+    engine.fail = False
+    tracker.record_added()
+    assert engine.writes[-1]["added"] == 2
+    tracker.finish("completed")
+
+
+def test_forced_flush_raises_and_still_unregisters(engine, clock):
+    job_id = uuid.uuid4()
+    tracker = job_progress.start(job_id, 10)
+    engine.fail = True
+    with pytest.raises(RuntimeError):
+        tracker.finish("failed")
+    assert job_progress.get(job_id) is None
+
+
+class FakeSession:
+    def __init__(self, job):
+        self.job = job
+
+    def query(self, model):
+        return self
+
+    def get(self, job_id):
+        return self.job if self.job and self.job.id == job_id else None
+
+
+def test_get_job_status_reads_tracker_then_db(engine, clock):
+    job_id = uuid.uuid4()
+    row = SimpleNamespace(
+        id=job_id,
+        status="running",
+        progress=0,
+        current=0,
+        total=4,
+        added=0,
+        skipped_duplicates=0,
+    )
+    db = FakeSession(row)
+
+    tracker = job_progress.start(job_id, 4)
+    tracker.record_added()
+    tracker.record_skipped()
+
+    live = collections.get_job_status(job_id, db=db)
+    assert live.current == 2
+    assert live.added == 1
+    assert live.skipped_duplicates == 1
+    assert live.progress == 50
+
+    tracker.finish("completed")
+    row.status, row.progress, row.current, row.added, row.skipped_duplicates = (
+        "completed", 100, 4, 3, 1
+    )
+
+    stored = collections.get_job_status(job_id, db=db)
+    assert stored.status == "completed"
+    assert stored.added == 3
+    assert stored.skipped_duplicates == 1
+
+
+def test_get_job_status_derives_counts_for_legacy_rows():
+    job_id = uuid.uuid4()
+    row = SimpleNamespace(
+        id=job_id,
+        status="completed",
+        progress=100,
+        current=7,
+        total=10,
+        added=None,
+        skipped_duplicates=None,
+    )
+
+    status = collections.get_job_status(job_id, db=FakeSession(row))
+    assert status.added == 7
+    assert status.skipped_duplicates == 3